@@ -0,0 +1,101 @@
+import pathlib
+import re
+import statistics
+import subprocess
+import sys
+
+
+ROOT = pathlib.Path(__file__).resolve().parent
+MODULES = [
+    'terraced_terrain.flat_terraced_terrain',
+    'terraced_terrain.spherical_terraced_terrain',
+    'gui',
+    'terraced_terrain_editor',
+]
+RUNS = 5
+TOP = 10
+
+# e.g. "import time:       328 |       1200 |   panda3d.core"
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def measure(module):
+    """Import the module in a fresh interpreter and return
+       the cumulative time [us] and the self time [us] of each imported module.
+        Args:
+            module (str): module name to be imported.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        raise ImportError(lines[-1] if lines else f'failed to import {module}')
+
+    # Importing a dotted module first imports its parent packages at the top level.
+    parents = module.split('.')
+    targets = {'.'.join(parents[:i]) for i in range(1, len(parents) + 1)}
+    total = 0
+    matched = False
+    self_times = {}
+    group = {}
+
+    for line in result.stderr.splitlines():
+        if not (m := LINE_PATTERN.match(line)):
+            continue
+
+        self_us, cumulative_us, indent, name = m.groups()
+        group[name] = int(self_us)
+
+        # A top-level line closes a group of nested imports. Only the groups
+        # closed by the target module and its parent packages are kept,
+        # so that the modules imported at interpreter startup are not counted.
+        if len(indent) == 1:
+            if name in targets:
+                total += int(cumulative_us)
+                self_times.update(group)
+                matched = matched or name == module
+            group = {}
+
+    if not matched:
+        raise ImportError(f'no import time was reported for {module}')
+
+    return total, self_times
+
+
+def bench(module):
+    totals = []
+    self_times = {}
+
+    for _ in range(RUNS):
+        total, times = measure(module)
+        totals.append(total)
+
+        for name, us in times.items():
+            self_times.setdefault(name, []).append(us)
+
+    print(f'{module}: median {statistics.median(totals) / 1000:.1f} ms '
+          f'(min {min(totals) / 1000:.1f} ms, max {max(totals) / 1000:.1f} ms, {RUNS} runs)')
+
+    heaviest = sorted(
+        ((statistics.median(v), k) for k, v in self_times.items()), reverse=True)
+
+    for us, name in heaviest[:TOP]:
+        print(f'    {us / 1000:8.1f} ms  {name}')
+
+
+def main():
+    for module in MODULES:
+        try:
+            bench(module)
+        except ImportError as e:
+            # e.g. Panda3D is not installed or the submodules are not checked out.
+            print(f'{module}: skipped ({e})')
+
+
+if __name__ == '__main__':
+    main()
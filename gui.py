@@ -1,8 +1,12 @@
 from enum import StrEnum
 
 import direct.gui.DirectGuiGlobals as DGG
-from direct.gui.DirectGui import DirectEntry, DirectFrame, DirectLabel, \
-    DirectButton, DirectRadioButton, DirectOptionMenu
+from direct.gui.DirectButton import DirectButton
+from direct.gui.DirectEntry import DirectEntry
+from direct.gui.DirectFrame import DirectFrame
+from direct.gui.DirectLabel import DirectLabel
+from direct.gui.DirectOptionMenu import DirectOptionMenu
+from direct.gui.DirectRadioButton import DirectRadioButton
 from panda3d.core import Point3, LColor, Vec4
 from panda3d.core import TextNode
 from panda3d.core import TransparencyAttrib